@@ -17,6 +17,7 @@ RES_ROOT_DATA_PATH=/path/to/data/dir python -m importers.djornl.parser
 """
 import argparse
 import csv
+import itertools
 import json
 import os
 import requests
@@ -29,6 +30,33 @@ from relation_engine_server.utils.json_validation import (
 )
 
 
+# maximum number of validation errors to report for a single row; a row that
+# fails more broadly than this is reported truncated rather than exhaustively
+MAX_ERRORS_PER_ROW = 10
+
+# location of the djornl dataset schemas, resolved once at import time since
+# __file__ never changes within a process
+_DATASET_SCHEMA_DIR = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)),
+    "../",
+    "../",
+    "spec",
+    "datasets",
+    "djornl",
+)
+
+# set RES_QUIET=1 to suppress progress output, e.g. for scripted runs where
+# only the summary (and exit code) matter
+_QUIET = os.environ.get("RES_QUIET") == "1"
+
+
+def note(message):
+    """Print a progress message, unless quiet mode is enabled."""
+    if _QUIET:
+        return
+    print(message)
+
+
 class DJORNL_Parser(object):
     def __init__(self):
 
@@ -37,6 +65,9 @@ class DJORNL_Parser(object):
         # dict of edges, indexed by node1__node2__edge_type
         self.edge_ix = {}
 
+        # session for RE API requests, so repeated uploads reuse one connection
+        self._session = requests.Session()
+
         # the order in which to parse the different data files
         self.parse_order = ["edges", "nodes", "clusters"]
 
@@ -90,13 +121,7 @@ class DJORNL_Parser(object):
 
     def _get_dataset_schema_dir(self):
 
-        if not hasattr(self, "_dataset_schema_dir"):
-            dir_path = os.path.dirname(os.path.realpath(__file__))
-            self._dataset_schema_dir = os.path.join(
-                dir_path, "../", "../", "spec", "datasets", "djornl"
-            )
-
-        return self._dataset_schema_dir
+        return _DATASET_SCHEMA_DIR
 
     def _get_manifest(self, configuration):
         """
@@ -270,7 +295,7 @@ class DJORNL_Parser(object):
         :param validator: (Validator)   jsonschema validator object
 
         """
-        print("Parsing " + file["data_type"] + " file " + file["file_path"])
+        note("Parsing " + file["data_type"] + " file " + file["file_path"])
         file_parser = self.parser_gen(file)
 
         def add_error(error):
@@ -310,9 +335,18 @@ class DJORNL_Parser(object):
             row_object = dict(zip(headers, cols))
 
             if validator is not None:
-                # validate the object
-                if not validator.is_valid(row_object):
-                    for e in sorted(validator.iter_errors(row_object), key=str):
+                # validate the object; a single iter_errors pass covers both the
+                # valid and invalid cases without walking the schema twice.
+                # Sorting within the capped slice keeps the output deterministic
+                # without sorting an unbounded error list for badly broken rows
+                errors = sorted(
+                    itertools.islice(
+                        validator.iter_errors(row_object), MAX_ERRORS_PER_ROW
+                    ),
+                    key=str,
+                )
+                if errors:
+                    for e in errors:
                         add_error(f"{file['path']} line {line_no}: " + e.message)
                     continue
 
@@ -656,18 +690,23 @@ class DJORNL_Parser(object):
 
     def save_docs(self, coll_name, docs, on_dupe="update"):
 
-        resp = requests.put(
+        # encode the NDJSON body up front so requests sends the bytes as-is
+        body = "\n".join(json.dumps(d) for d in docs).encode("utf-8")
+        resp = self._session.put(
             self.config("API_URL") + "/api/v1/documents",
             params={"collection": coll_name, "on_duplicate": on_dupe},
-            headers={"Authorization": self.config("AUTH_TOKEN")},
-            data="\n".join(json.dumps(d) for d in docs),
+            headers={
+                "Authorization": self.config("AUTH_TOKEN"),
+                "Content-Type": "application/x-ndjson",
+            },
+            data=body,
         )
         if not resp.ok:
             raise RuntimeError(resp.text)
 
-        print(f"Saved docs to collection {coll_name}!")
-        print(resp.text)
-        print("=" * 80)
+        note(f"Saved docs to collection {coll_name}!")
+        note(resp.text)
+        note("=" * 80)
         return resp
 
     def load_data(self, dry_run=False):
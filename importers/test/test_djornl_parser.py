@@ -14,6 +14,7 @@ from importers.djornl.parser import DJORNL_Parser
 from spec.test.helpers import modified_environ
 
 _TEST_DIR = "/app/spec/test"
+_TEST_DATA_DIR = os.path.join(_TEST_DIR, "djornl", "test_data")
 
 
 class Test_DJORNL_Parser(unittest.TestCase):
@@ -34,6 +35,13 @@ class Test_DJORNL_Parser(unittest.TestCase):
             parser._configure()
             return parser
 
+    def init_test_data_parser(self):
+        """set up a parser on the valid test_data directory
+
+        The load_* methods accumulate state on the parser, so each test gets a
+        fresh instance rather than one shared via setUpClass"""
+        return self.init_parser_with_path(_TEST_DATA_DIR)
+
     def test_errors(self, parser=None, errs={}):
         if parser is None:
             self.assertTrue(True)
@@ -66,8 +74,7 @@ class Test_DJORNL_Parser(unittest.TestCase):
 
     def test_config(self):
         """test that the parser raises an error if a config value cannot be found"""
-        RES_ROOT_DATA_PATH = os.path.join(_TEST_DIR, "djornl", "test_data")
-        parser = self.init_parser_with_path(RES_ROOT_DATA_PATH)
+        parser = self.init_test_data_parser()
         with self.assertRaisesRegex(KeyError, "No such config value: bananas"):
             parser.config("bananas")
 
@@ -233,41 +240,40 @@ class Test_DJORNL_Parser(unittest.TestCase):
     def test_load_valid_edge_data(self):
         """ensure that valid edge data can be parsed"""
 
-        RES_ROOT_DATA_PATH = os.path.join(_TEST_DIR, "djornl", "test_data")
-        parser = self.init_parser_with_path(RES_ROOT_DATA_PATH)
+        parser = self.init_test_data_parser()
 
         edge_data = parser.load_edges()
         expected = self.json_data["load_edges"]
 
-        for data_structure in [edge_data, expected]:
-            for k in data_structure.keys():
-                data_structure[k] = sorted(data_structure[k], key=lambda n: n["_key"])
-        expected["err_list"] = []
-
-        self.assertEqual(edge_data, expected)
+        self.assertEqual(list(edge_data["err_list"]), [])
+        # keying on '_key' makes the comparison order-independent without
+        # sorting, and pinpoints the offending key on failure
+        for k in ["nodes", "edges"]:
+            self.assertEqual(
+                {n["_key"]: n for n in edge_data[k]},
+                {n["_key"]: n for n in expected[k]},
+            )
 
     def test_load_valid_node_data(self):
         """ensure that valid node data can be parsed"""
 
-        RES_ROOT_DATA_PATH = os.path.join(_TEST_DIR, "djornl", "test_data")
-        parser = self.init_parser_with_path(RES_ROOT_DATA_PATH)
+        parser = self.init_test_data_parser()
 
         node_data = parser.load_nodes()
         expected = self.json_data["load_nodes"]
 
-        for data_structure in [node_data, expected]:
-            for k in data_structure.keys():
-                data_structure[k] = sorted(data_structure[k], key=lambda n: n["_key"])
-                data_structure[k] = [n["_key"] for n in data_structure[k]]
-        expected["err_list"] = []
-
-        self.assertEqual(node_data, expected)
+        self.assertEqual(list(node_data["err_list"]), [])
+        # as in the edge test, compare on '_key' rather than sorting; this
+        # test only checks which nodes were loaded, not their contents
+        self.assertEqual(
+            {n["_key"] for n in node_data["nodes"]},
+            {n["_key"] for n in expected["nodes"]},
+        )
 
     def test_load_valid_cluster_data(self):
         """ensure that valid cluster data can be parsed"""
 
-        RES_ROOT_DATA_PATH = os.path.join(_TEST_DIR, "djornl", "test_data")
-        parser = self.init_parser_with_path(RES_ROOT_DATA_PATH)
+        parser = self.init_test_data_parser()
 
         cluster_data = parser.load_clusters()
         expected = self.json_data["load_clusters"]
@@ -311,8 +317,7 @@ class Test_DJORNL_Parser(unittest.TestCase):
 
     def test_dry_run(self):
 
-        RES_ROOT_DATA_PATH = os.path.join(_TEST_DIR, "djornl", "test_data")
-        parser = self.init_parser_with_path(RES_ROOT_DATA_PATH)
+        parser = self.init_test_data_parser()
 
         output = parser.load_data(dry_run=True)
         self.assertEqual(
@@ -338,8 +343,7 @@ class Test_DJORNL_Parser(unittest.TestCase):
     def test_try_node_merge(self):
         """test node merging"""
 
-        RES_ROOT_DATA_PATH = os.path.join(_TEST_DIR, "djornl", "test_data")
-        parser = self.init_parser_with_path(RES_ROOT_DATA_PATH)
+        parser = self.init_test_data_parser()
 
         tests = [
             {
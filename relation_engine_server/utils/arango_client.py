@@ -144,12 +144,17 @@ def _index_exists(idx_conf, indexes):
 def import_from_file(file_path, query):
     """Import documents from a file."""
     with open(file_path, "rb") as file_desc:
-        resp = requests.post(
-            _CONF["api_url"] + "/import",
-            data=file_desc,
-            auth=(_CONF["db_user"], _CONF["db_pass"]),
-            params=query,
-        )
+        return import_from_stream(file_desc, query)
+
+
+def import_from_stream(stream, query):
+    """Import documents from a readable file-like object of NDJSON bytes."""
+    resp = requests.post(
+        _CONF["api_url"] + "/import",
+        data=stream,
+        auth=(_CONF["db_user"], _CONF["db_pass"]),
+        params=query,
+    )
     if not resp.ok:
         raise ArangoServerError(resp.text)
     resp_json = resp.json()
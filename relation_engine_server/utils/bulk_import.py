@@ -7,7 +7,24 @@ import hashlib
 
 from relation_engine_server.utils.json_validation import get_schema_validator
 from relation_engine_server.utils.spec_loader import get_collection
-from relation_engine_server.utils.arango_client import import_from_file
+from relation_engine_server.utils.arango_client import import_from_stream
+
+# Validators, keyed on (schema_file, mtime), so that each collection schema is
+# parsed and compiled once per process rather than once per request
+_VALIDATOR_CACHE = {}
+
+# Number of serialized lines to accumulate before writing to the temp file
+_WRITE_BATCH_SIZE = 4096
+
+
+def _get_cached_validator(schema_file):
+    """Fetch or build a validator for a schema file, rebuilding if the file changes."""
+    key = (schema_file, os.path.getmtime(schema_file))
+    if key not in _VALIDATOR_CACHE:
+        _VALIDATOR_CACHE[key] = get_schema_validator(
+            schema_file=schema_file, validate_at="/schema"
+        )
+    return _VALIDATOR_CACHE[key]
 
 
 def bulk_import(query_params):
@@ -17,32 +34,41 @@ def bulk_import(query_params):
     arango client.
     """
     schema_file = get_collection(query_params["collection"], path_only=True)
-    validator = get_schema_validator(schema_file=schema_file, validate_at="/schema")
-    # We can't use a context manager here
-    # We need to close the file to have the file contents readable
-    #  and we need to prevent deletion of the temp file on close (default behavior of tempfiles)
-    temp_fd = tempfile.NamedTemporaryFile(mode="a", delete=False)
-    try:
+    validator = _get_cached_validator(schema_file)
+    # The temp file holds the full validated payload so that nothing reaches
+    # arango if any line fails validation part-way through the request.
+    # An anonymous temp file can be rewound and streamed to arango directly,
+    # and is removed by the OS on close.
+    with tempfile.TemporaryFile() as temp_fd:
         # Stream request data line-by-line
         # Parse each line to json, validate the schema, and write to a file
+        # Writes are batched so that large imports don't pay a file write per line
+        # All lines in a request share one updated_at: the time the request arrived
+        updated_at = int(time.time() * 1000)
+        write_buffer = []
         for line in flask.request.stream:
             json_line = json.loads(line)
             validator.validate(json_line)
             json_line = _write_edge_key(json_line)
-            json_line["updated_at"] = int(time.time() * 1000)
-            temp_fd.write(json.dumps(json_line) + "\n")
-        temp_fd.close()
-        resp_json = import_from_file(temp_fd.name, query_params)
-    finally:
-        # Always remove the temp file
-        os.remove(temp_fd.name)
+            json_line["updated_at"] = updated_at
+            write_buffer.append(json.dumps(json_line) + "\n")
+            if len(write_buffer) >= _WRITE_BATCH_SIZE:
+                temp_fd.write("".join(write_buffer).encode())
+                write_buffer.clear()
+        if write_buffer:
+            temp_fd.write("".join(write_buffer).encode())
+        temp_fd.seek(0)
+        resp_json = import_from_stream(temp_fd, query_params)
     return resp_json
 
 
 def _write_edge_key(json_line):
     """For edges, we want a deterministic key so there are no duplicates."""
     if "_key" not in json_line and "_from" in json_line and "_to" in json_line:
-        json_line["_key"] = hashlib.blake2b(
-            json_line["_from"].encode() + json_line["_to"].encode(), digest_size=8
-        ).hexdigest()
+        # feed the hasher in two steps to avoid concatenating a throwaway
+        # bytes object for every edge
+        hasher = hashlib.blake2b(digest_size=8)
+        hasher.update(json_line["_from"].encode())
+        hasher.update(json_line["_to"].encode())
+        json_line["_key"] = hasher.hexdigest()
     return json_line
@@ -18,10 +18,15 @@ from jsonschema.compat import (
 )
 from jsonschema.exceptions import ValidationError
 from jsonpointer import resolve_pointer
+import os
 import yaml
 import json
 import requests
 
+# parsed schema files, keyed on (file path, mtime); schemas are read-only once
+# loaded, so they can safely be shared between validators
+_SCHEMA_CACHE = {}
+
 
 def extend_with_default(validator_class):
     validate_properties = validator_class.VALIDATORS["properties"]
@@ -67,7 +72,10 @@ def get_schema_validator(schema=None, schema_file=None, validate_at=""):
 
     # schema to validate against
     if schema is None:
-        schema = _load_json_schema(schema_file)
+        cache_key = (schema_file, os.path.getmtime(schema_file))
+        if cache_key not in _SCHEMA_CACHE:
+            _SCHEMA_CACHE[cache_key] = _load_json_schema(schema_file)
+        schema = _SCHEMA_CACHE[cache_key]
 
     # get the appropriate location in the schema
     validation_schema = resolve_pointer(schema, validate_at)